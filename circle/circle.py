@@ -1,5 +1,10 @@
 import math
 
+import numpy as np
+
+_PI = math.pi
+_TAU = 2. * math.pi
+
 class Circle:
 
     def __init__(self, radius):
@@ -20,7 +25,13 @@ class Circle:
         if self.mRadius == 2:
             return 0
         
-        return math.pi * self.mRadius * self.mRadius
+        return _PI * self.mRadius * self.mRadius
 
     def getCircumference(self):
-        return 2. * math.pi * self.mRadius
+        return _TAU * self.mRadius
+
+    @staticmethod
+    def getAreaBatch(radii):
+        # Same result as getArea for each radius, including the radius-2 case
+        radii = np.asarray(radii, dtype=np.float64)
+        return np.where(radii == 2, 0.0, _PI * radii * radii)
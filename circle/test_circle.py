@@ -32,6 +32,17 @@ class test_circle(unittest.TestCase):
         circle = Circle(10)
         self.assertEqual(circle.getCircumference(), 62.83185307179586)
 
+    def test_getAreaBatch(self):
+        areas = Circle.getAreaBatch([0, 1, 10])
+        self.assertEqual(areas[0], 0)
+        self.assertEqual(areas[1], Circle(1).getArea())
+        self.assertEqual(areas[2], 314.1592653589793)
+
+    def test_getAreaBatch_zed(self):
+        areas = Circle.getAreaBatch([2, 3])
+        self.assertEqual(areas[0], Circle(2).getArea())
+        self.assertEqual(areas[1], Circle(3).getArea())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,31 @@
+# Numba kernel behind space_ship.step_fleet.
+# Imported lazily on the first step_fleet call; importing this module
+# requires Numba and compiles the kernel (cached in __pycache__).
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+# Explicit signature: compiled once instead of per argument type.
+# Arguments are validated by step_fleet; the kernel itself does no bounds checks.
+@njit(["b1[:](f8[:, :], f8[:, :], f8[:], f8, f8)"], parallel=True, cache=True)
+def step_fleet_parallel(positions, velocities, fuel, fuel_rate, time_delta):
+    count = positions.shape[0]
+    moved = np.zeros(count, dtype=np.bool_)
+    if time_delta <= 0:
+        return moved
+
+    for i in prange(count):
+        vx = velocities[i, 0]
+        vy = velocities[i, 1]
+        vz = velocities[i, 2]
+        fuel_needed = math.sqrt(vx*vx + vy*vy + vz*vz) * time_delta * fuel_rate
+        if fuel_needed <= fuel[i]:
+            positions[i, 0] += vx * time_delta
+            positions[i, 1] += vy * time_delta
+            positions[i, 2] += vz * time_delta
+            fuel[i] -= fuel_needed
+            moved[i] = True
+    return moved
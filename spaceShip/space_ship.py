@@ -2,14 +2,46 @@
 # Created by: Claude (Anthropic AI Assistant)
 # A comprehensive navigation system for spaceship movement and positioning
 
+from __future__ import annotations
+
 import math
-from typing import Tuple, List, Optional, Dict
-from enum import Enum
+from collections import deque
+from typing import NamedTuple
+from enum import IntEnum
+
+import numpy as np
+
+# Module-level bindings avoid a `math` attribute lookup on every call
+_sqrt = math.sqrt
+_atan2 = math.atan2
 
-class NavigationMode(Enum):
-    MANUAL = "manual"
-    AUTOPILOT = "autopilot"
-    EMERGENCY = "emergency"
+# Relative slack on move's squared fuel pre-check, far above its rounding error
+_FUEL_SQ_MARGIN = 1.0 + 1e-9
+
+class NavigationMode(IntEnum):
+    MANUAL = 0
+    AUTOPILOT = 1
+    EMERGENCY = 2
+
+class NavStatus(NamedTuple):
+    """
+    Snapshot returned by SpaceshipNavigation.get_navigation_status().
+    Read fields as attributes (status.fuel_level); callers that need the old
+    dict form, e.g. status['fuel_level'], should use as_dict().
+    """
+    position: tuple[float, float, float]
+    velocity: tuple[float, float, float]
+    fuel_level: float
+    fuel_percentage: float
+    navigation_mode: str
+    navigation_locked: bool
+    is_engine_active: bool
+    waypoints_remaining: int
+    total_distance_traveled: int
+
+    def as_dict(self) -> dict:
+        """Return status as a plain dict."""
+        return self._asdict()
 
 class SpaceshipNavigation:
     """
@@ -17,6 +49,13 @@ class SpaceshipNavigation:
     movement, fuel management, and navigation calculations in 3D space.
     """
 
+    __slots__ = ('x', 'y', 'z',
+                 'velocity_x', 'velocity_y', 'velocity_z',
+                 'fuel_level', 'max_fuel', 'fuel_consumption_rate', 'max_speed',
+                 '_mode', 'is_engine_active', 'navigation_locked',
+                 '_wp', '_wp_count', 'current_waypoint_index',
+                 '_max_history_size', 'position_history')
+
     def __init__(self, initial_x: float = 0.0, initial_y: float = 0.0, initial_z: float = 0.0):
         # Position coordinates (in space units)
         self.x = float(initial_x)
@@ -35,23 +74,64 @@ class SpaceshipNavigation:
         self.max_speed = 100.0  # maximum velocity in any direction
 
         # Navigation mode and status
-        self.navigation_mode = NavigationMode.MANUAL
+        self._mode = NavigationMode.MANUAL
         self.is_engine_active = False
         self.navigation_locked = False
 
-        # Waypoint system
-        self.waypoints: List[Tuple[float, float, float]] = []
+        # Waypoint system (contiguous (N, 3) buffer, grown by doubling)
+        self._wp = np.empty((16, 3), dtype=np.float64)
+        self._wp_count = 0
         self.current_waypoint_index = 0
 
-        # Navigation history
-        self.position_history: List[Tuple[float, float, float]] = [(self.x, self.y, self.z)]
-        self.max_history_size = 100
+        # Navigation history (bounded; oldest entries drop off automatically)
+        self._max_history_size = 100
+        self.position_history: deque = deque([(self.x, self.y, self.z)], maxlen=self._max_history_size)
+
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of positions kept in position_history."""
+        return self._max_history_size
 
-    def get_position(self) -> Tuple[float, float, float]:
+    @max_history_size.setter
+    def max_history_size(self, size: int):
+        # deque's maxlen is fixed, so rebuild it; this keeps the newest entries
+        self._max_history_size = size
+        self.position_history = deque(self.position_history, maxlen=size)
+
+    @property
+    def navigation_mode(self) -> NavigationMode:
+        """
+        Current navigation mode.
+        Assigning anything other than a NavigationMode member (including a
+        plain int) raises ValueError; set_navigation_mode returns False instead.
+        """
+        return self._mode
+
+    @navigation_mode.setter
+    def navigation_mode(self, mode: NavigationMode):
+        if not isinstance(mode, NavigationMode):
+            raise ValueError(f"navigation_mode must be a NavigationMode, got {mode!r}")
+        self._mode = mode
+
+    @property
+    def waypoints(self) -> tuple[tuple[float, float, float], ...]:
+        """
+        Read-only snapshot of the waypoint route as (x, y, z) tuples.
+        Built from the waypoint buffer on every access; use add_waypoint and
+        clear_waypoints to change the route and waypoint_count to count it.
+        """
+        return tuple(map(tuple, self._wp[:self._wp_count].tolist()))
+
+    @property
+    def waypoint_count(self) -> int:
+        """Number of waypoints in the route."""
+        return self._wp_count
+
+    def get_position(self) -> tuple[float, float, float]:
         """Return current position as (x, y, z) tuple."""
         return (self.x, self.y, self.z)
 
-    def get_velocity(self) -> Tuple[float, float, float]:
+    def get_velocity(self) -> tuple[float, float, float]:
         """Return current velocity as (vx, vy, vz) tuple."""
         return (self.velocity_x, self.velocity_y, self.velocity_z)
 
@@ -63,9 +143,10 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        self.x = float(x)
-        self.y = float(y)
-        self.z = float(z)
+        # Skip the float() call for the common case of float arguments
+        self.x = x if type(x) is float else float(x)
+        self.y = y if type(y) is float else float(y)
+        self.z = z if type(z) is float else float(z)
         self._add_to_history()
         return True
 
@@ -74,30 +155,32 @@ class SpaceshipNavigation:
         Move spaceship by relative amounts.
         Returns False if insufficient fuel or navigation locked.
         """
-        if self.navigation_locked:
+        distance_sq = dx*dx + dy*dy + dz*dz
+        rate = self.fuel_consumption_rate
+        fuel_level = self.fuel_level
+
+        # Common case first: an unlocked, non-zero move the ship can afford.
+        # The squared fuel check rejects clearly unaffordable moves without
+        # paying for the sqrt; the margin sends near-boundary moves on to the
+        # exact check below, since squaring can round either way.
+        if (not self.navigation_locked and distance_sq != 0
+                and distance_sq * rate * rate <= fuel_level * fuel_level * _FUEL_SQ_MARGIN):
+            fuel_needed = _sqrt(distance_sq) * rate
+            if fuel_needed <= fuel_level:
+                # Update position
+                self.x += dx
+                self.y += dy
+                self.z += dz
+
+                # Consume fuel
+                self.fuel_level -= fuel_needed
+                self._add_to_history()
+
+                return True
             return False
 
-        # Calculate distance
-        distance = math.sqrt(dx*dx + dy*dy + dz*dz)
-
-        if distance == 0:
-            return True
-
-        # Check fuel
-        fuel_needed = distance * self.fuel_consumption_rate
-        if fuel_needed > self.fuel_level:
-            return False
-
-        # Update position
-        self.x += dx
-        self.y += dy
-        self.z += dz
-
-        # Consume fuel
-        self.fuel_level -= fuel_needed
-        self._add_to_history()
-
-        return True
+        # Locked or insufficient fuel; a zero move is a successful no-op
+        return not self.navigation_locked and distance_sq == 0
 
     def set_velocity(self, vx: float, vy: float, vz: float) -> bool:
         """
@@ -107,13 +190,16 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        # Check speed limits
-        if abs(vx) > self.max_speed or abs(vy) > self.max_speed or abs(vz) > self.max_speed:
-            return False
+        # Check speed limits. A vector inside the max_speed sphere is always
+        # inside the per-component box, so one compare accepts the common case.
+        max_speed = self.max_speed
+        if vx*vx + vy*vy + vz*vz > max_speed*max_speed:
+            if max(abs(vx), abs(vy), abs(vz)) > max_speed:
+                return False
 
-        self.velocity_x = float(vx)
-        self.velocity_y = float(vy)
-        self.velocity_z = float(vz)
+        self.velocity_x = vx if type(vx) is float else float(vx)
+        self.velocity_y = vy if type(vy) is float else float(vy)
+        self.velocity_z = vz if type(vz) is float else float(vz)
 
         return True
 
@@ -130,12 +216,14 @@ class SpaceshipNavigation:
         new_vy = self.velocity_y + ay * time_delta
         new_vz = self.velocity_z + az * time_delta
 
-        # Check speed limits
-        if abs(new_vx) > self.max_speed or abs(new_vy) > self.max_speed or abs(new_vz) > self.max_speed:
-            return False
+        # Check speed limits (sphere fast path, see set_velocity)
+        max_speed = self.max_speed
+        if new_vx*new_vx + new_vy*new_vy + new_vz*new_vz > max_speed*max_speed:
+            if max(abs(new_vx), abs(new_vy), abs(new_vz)) > max_speed:
+                return False
 
         # Calculate fuel for acceleration (acceleration requires more fuel)
-        acceleration_magnitude = math.sqrt(ax*ax + ay*ay + az*az)
+        acceleration_magnitude = _sqrt(ax*ax + ay*ay + az*az)
         fuel_needed = acceleration_magnitude * time_delta * 2.0  # 2x fuel rate for acceleration
 
         if fuel_needed > self.fuel_level:
@@ -157,22 +245,40 @@ class SpaceshipNavigation:
         if self.navigation_locked or time_delta <= 0:
             return False
 
-        # Calculate movement
-        dx = self.velocity_x * time_delta
-        dy = self.velocity_y * time_delta
-        dz = self.velocity_z * time_delta
+        # Same as move(v * time_delta), inlined: distance is |v| * time_delta
+        vx = self.velocity_x
+        vy = self.velocity_y
+        vz = self.velocity_z
+        speed_sq = vx*vx + vy*vy + vz*vz
 
-        # Use move method which handles fuel consumption
-        return self.move(dx, dy, dz)
+        if speed_sq == 0:
+            return True
+
+        # Check fuel
+        distance = _sqrt(speed_sq) * time_delta
+        fuel_needed = distance * self.fuel_consumption_rate
+        if fuel_needed > self.fuel_level:
+            return False
+
+        # Update position
+        self.x += vx * time_delta
+        self.y += vy * time_delta
+        self.z += vz * time_delta
+
+        # Consume fuel
+        self.fuel_level -= fuel_needed
+        self._add_to_history()
+
+        return True
 
     def calculate_distance_to(self, target_x: float, target_y: float, target_z: float) -> float:
         """Calculate distance to target coordinates."""
         dx = target_x - self.x
         dy = target_y - self.y
         dz = target_z - self.z
-        return math.sqrt(dx*dx + dy*dy + dz*dz)
+        return _sqrt(dx*dx + dy*dy + dz*dz)
 
-    def calculate_heading_to(self, target_x: float, target_y: float, target_z: float) -> Tuple[float, float]:
+    def calculate_heading_to(self, target_x: float, target_y: float, target_z: float) -> tuple[float, float]:
         """
         Calculate heading angles to target.
         Returns (azimuth, elevation) in radians.
@@ -184,19 +290,19 @@ class SpaceshipNavigation:
         dz = target_z - self.z
 
         # Calculate azimuth (angle in XY plane)
-        azimuth = math.atan2(dy, dx)
+        azimuth = _atan2(dy, dx)
 
         # Calculate elevation (angle from XY plane to target)
-        xy_distance = math.sqrt(dx*dx + dy*dy)
+        xy_distance = _sqrt(dx*dx + dy*dy)
         if xy_distance == 0 and dz == 0:
             elevation = 0.0  # No movement needed
         else:
-            elevation = math.atan2(dz, xy_distance)
+            elevation = _atan2(dz, xy_distance)
 
         return (azimuth, elevation)
 
     def navigate_to_target(self, target_x: float, target_y: float, target_z: float,
-                          max_speed: Optional[float] = None) -> bool:
+                          max_speed: float | None = None) -> bool:
         """
         Set velocity to move toward target at specified speed.
         Returns False if insufficient fuel or navigation locked.
@@ -204,8 +310,11 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        # Calculate direction
-        distance = self.calculate_distance_to(target_x, target_y, target_z)
+        # Calculate direction once and reuse it for the normalization
+        dx = target_x - self.x
+        dy = target_y - self.y
+        dz = target_z - self.z
+        distance = _sqrt(dx*dx + dy*dy + dz*dz)
         if distance == 0:
             return self.set_velocity(0, 0, 0)
 
@@ -213,12 +322,9 @@ class SpaceshipNavigation:
         speed = max_speed if max_speed is not None else self.max_speed
         speed = min(speed, self.max_speed)  # Don't exceed ship's max speed
 
-        # Calculate unit direction vector
-        dx = target_x - self.x
-        dy = target_y - self.y
-        dz = target_z - self.z
-
-        # Normalize and scale by speed
+        # Normalize and scale by speed. Dividing each component first keeps
+        # axis-aligned results exactly at speed; multiplying by speed/distance
+        # can round one ulp past max_speed and get rejected by set_velocity.
         vx = (dx / distance) * speed
         vy = (dy / distance) * speed
         vz = (dz / distance) * speed
@@ -230,7 +336,18 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        self.waypoints.append((float(x), float(y), float(z)))
+        # Convert before growing so invalid coordinates leave the route untouched
+        x = x if type(x) is float else float(x)
+        y = y if type(y) is float else float(y)
+        z = z if type(z) is float else float(z)
+
+        if self._wp_count == len(self._wp):
+            grown = np.empty((2 * len(self._wp), 3), dtype=np.float64)
+            grown[:self._wp_count] = self._wp
+            self._wp = grown
+
+        self._wp[self._wp_count] = (x, y, z)
+        self._wp_count += 1
         return True
 
     def clear_waypoints(self) -> bool:
@@ -238,15 +355,15 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        self.waypoints.clear()
+        self._wp_count = 0
         self.current_waypoint_index = 0
         return True
 
-    def get_next_waypoint(self) -> Optional[Tuple[float, float, float]]:
+    def get_next_waypoint(self) -> tuple[float, float, float] | None:
         """Get next waypoint in route, or None if no waypoints remain."""
-        if self.current_waypoint_index >= len(self.waypoints):
+        if self.current_waypoint_index >= self._wp_count:
             return None
-        return self.waypoints[self.current_waypoint_index]
+        return tuple(self._wp[self.current_waypoint_index].tolist())
 
     def advance_to_next_waypoint(self) -> bool:
         """
@@ -256,12 +373,17 @@ class SpaceshipNavigation:
         if self.navigation_locked:
             return False
 
-        if self.current_waypoint_index >= len(self.waypoints):
+        if self.current_waypoint_index >= self._wp_count:
             return False
 
         self.current_waypoint_index += 1
         return True
 
+    def distances_to_all_waypoints(self) -> np.ndarray:
+        """Return distances from current position to every waypoint."""
+        offsets = self._wp[:self._wp_count] - np.array([self.x, self.y, self.z])
+        return np.sqrt((offsets * offsets).sum(axis=1))
+
     def navigate_waypoint_route(self, waypoint_threshold: float = 5.0) -> bool:
         """
         Navigate to next waypoint, auto-advancing when close enough.
@@ -295,6 +417,26 @@ class SpaceshipNavigation:
 
         return actual_fuel_added
 
+    @classmethod
+    def refuel_many(cls, ships: list[SpaceshipNavigation], fuel_amounts) -> np.ndarray:
+        """
+        Refuel a fleet of spaceships at once.
+        fuel_amounts is a scalar or one amount per ship.
+        Returns array of fuel actually added to each ship (see refuel).
+        """
+        count = len(ships)
+        fuels = np.fromiter((ship.fuel_level for ship in ships), dtype=np.float64, count=count)
+        caps = np.fromiter((ship.max_fuel for ship in ships), dtype=np.float64, count=count)
+        amounts = np.broadcast_to(np.asarray(fuel_amounts, dtype=np.float64), (count,))
+
+        added = np.where(amounts > 0, np.minimum(amounts, caps - fuels), 0.0)
+        fuels += added
+
+        for ship, fuel in zip(ships, fuels.tolist()):
+            ship.fuel_level = fuel
+
+        return added
+
     def get_fuel_percentage(self) -> float:
         """Return fuel level as percentage of maximum."""
         return (self.fuel_level / self.max_fuel) * 100.0
@@ -309,12 +451,24 @@ class SpaceshipNavigation:
         fuel_needed = self.estimate_fuel_for_distance(distance)
         return fuel_needed <= self.fuel_level
 
+    def can_reach_waypoints(self) -> np.ndarray:
+        """Check, for every waypoint, if spaceship has enough fuel to reach it."""
+        fuel_needed = self.distances_to_all_waypoints() * self.fuel_consumption_rate
+        return fuel_needed <= self.fuel_level
+
     def set_navigation_mode(self, mode: NavigationMode) -> bool:
-        """Set navigation mode."""
+        """
+        Set navigation mode.
+        Returns False if mode is not a NavigationMode or navigation is locked
+        (only EMERGENCY may be set while locked).
+        """
+        if not isinstance(mode, NavigationMode):
+            return False
+
         if self.navigation_locked and mode != NavigationMode.EMERGENCY:
             return False
 
-        self.navigation_mode = mode
+        self._mode = mode
         return True
 
     def lock_navigation(self, locked: bool) -> bool:
@@ -322,7 +476,7 @@ class SpaceshipNavigation:
         Lock or unlock navigation controls.
         Can always unlock, but locking requires manual mode.
         """
-        if locked and self.navigation_mode != NavigationMode.MANUAL:
+        if locked and self._mode != NavigationMode.MANUAL:
             return False
 
         self.navigation_locked = locked
@@ -333,26 +487,88 @@ class SpaceshipNavigation:
         self.velocity_x = 0.0
         self.velocity_y = 0.0
         self.velocity_z = 0.0
-        self.navigation_mode = NavigationMode.EMERGENCY
+        self._mode = NavigationMode.EMERGENCY
         self.navigation_locked = False  # Emergency mode overrides lock
         return True
 
-    def get_navigation_status(self) -> Dict:
+    def get_navigation_status(self) -> NavStatus:
         """Get comprehensive navigation status."""
-        return {
-            'position': self.get_position(),
-            'velocity': self.get_velocity(),
-            'fuel_level': self.fuel_level,
-            'fuel_percentage': self.get_fuel_percentage(),
-            'navigation_mode': self.navigation_mode.value,
-            'navigation_locked': self.navigation_locked,
-            'is_engine_active': self.is_engine_active,
-            'waypoints_remaining': len(self.waypoints) - self.current_waypoint_index,
-            'total_distance_traveled': len(self.position_history)
-        }
+        return NavStatus(
+            self.get_position(),
+            self.get_velocity(),
+            self.fuel_level,
+            self.get_fuel_percentage(),
+            self._mode.name.lower(),
+            self.navigation_locked,
+            self.is_engine_active,
+            self._wp_count - self.current_waypoint_index,
+            len(self.position_history)
+        )
+
+    def get_history(self) -> list[tuple[float, float, float]]:
+        """Return recorded positions, oldest first."""
+        return list(self.position_history)
 
     def _add_to_history(self):
         """Add current position to history, maintaining size limit."""
         self.position_history.append((self.x, self.y, self.z))
-        if len(self.position_history) > self.max_history_size:
-            self.position_history.pop(0)
+
+
+def _check_fleet_array(name: str, array, shape: tuple) -> None:
+    """Require a writable float64 array of the given shape (-1 matches any length)."""
+    if not isinstance(array, np.ndarray) or array.dtype != np.float64:
+        raise TypeError(f"{name} must be a float64 numpy array")
+    if array.ndim != len(shape) or any(want not in (-1, got) for want, got in zip(shape, array.shape)):
+        raise ValueError(f"{name} must have shape {shape}, got {array.shape}")
+    if not array.flags.writeable:
+        raise ValueError(f"{name} must be writable")
+
+
+def step_fleet(positions: np.ndarray, velocities: np.ndarray, fuel: np.ndarray,
+               fuel_rate: float, time_delta: float) -> np.ndarray:
+    """
+    Advance a fleet of ships by one time step, like navigate_time_step.
+    positions is an (N, 3) and fuel an (N,) writable float64 array, both
+    updated in place; velocities is anything convertible to an (N, 3) float
+    array. Navigation locks and position history are not tracked here.
+    Raises TypeError/ValueError for arrays of the wrong dtype or shape.
+    Returns boolean array of which ships moved (False if insufficient fuel).
+    """
+    _check_fleet_array('positions', positions, (-1, 3))
+    count = len(positions)
+    _check_fleet_array('fuel', fuel, (count,))
+
+    velocities = np.asarray(velocities, dtype=np.float64)
+    if velocities.shape != (count, 3):
+        raise ValueError(f"velocities must have shape ({count}, 3), got {velocities.shape}")
+    if not velocities.flags.writeable:
+        velocities = velocities.copy()  # the compiled kernel only takes writable arrays
+
+    kernel = _step_fleet_kernel or _load_step_fleet_kernel()
+    return kernel(positions, velocities, fuel, float(fuel_rate), float(time_delta))
+
+
+def _step_fleet_numpy(positions, velocities, fuel, fuel_rate, time_delta):
+    if time_delta <= 0:
+        return np.zeros(len(positions), dtype=np.bool_)
+
+    fuel_needed = np.sqrt((velocities * velocities).sum(axis=1)) * time_delta * fuel_rate
+    moved = fuel_needed <= fuel
+    positions[moved] += velocities[moved] * time_delta
+    fuel[moved] -= fuel_needed[moved]
+    return moved
+
+
+# Chosen on the first step_fleet call so importing this module never loads Numba
+_step_fleet_kernel = None
+
+
+def _load_step_fleet_kernel():
+    """Use the compiled Numba fleet kernel if Numba is installed, else NumPy."""
+    global _step_fleet_kernel
+    try:
+        from _fleet_kernels import step_fleet_parallel as kernel
+    except ImportError:  # Numba is optional; fall back to plain NumPy
+        kernel = _step_fleet_numpy
+    _step_fleet_kernel = kernel
+    return kernel
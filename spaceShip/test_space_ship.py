@@ -1,5 +1,7 @@
 import math
+import random
 import unittest
+import numpy as np
 from space_ship import *
 
 class test_space_ship(unittest.TestCase):
@@ -12,6 +14,21 @@ class test_space_ship(unittest.TestCase):
         ship = SpaceshipNavigation()
         self.assertEqual(ship.get_velocity(), (0, 0, 0))
 
+    def test_no_instance_dict(self):
+        ship = SpaceshipNavigation()
+        self.assertFalse(hasattr(ship, '__dict__'))
+        with self.assertRaises(AttributeError):
+            ship.altitude = 5
+
+    def test_get_state_after_direct_assignment(self):
+        ship = SpaceshipNavigation()
+        ship.get_position()
+        ship.get_velocity()
+        ship.x = 4.0
+        ship.velocity_x = 5.0
+        self.assertEqual(ship.get_position(), (4.0, 0, 0))
+        self.assertEqual(ship.get_velocity(), (5.0, 0, 0))
+
     # Position
     def test_set_position_locked(self):
         ship = SpaceshipNavigation()
@@ -53,6 +70,18 @@ class test_space_ship(unittest.TestCase):
         result = ship.set_velocity(999, 999, 999)
         self.assertFalse(result)
 
+    def test_velocity_component_limit(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.set_velocity(90, 90, 90))
+        self.assertFalse(ship.set_velocity(101, 0, 0))
+        self.assertTrue(ship.set_velocity(-100, 0, 0))
+
+    def test_velocity_stored_as_float(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(1, 2.5, True)
+        for component in ship.get_velocity():
+            self.assertIs(type(component), float)
+
     def test_velocity_changed_locked(self):
         ship = SpaceshipNavigation()
         ship.lock_navigation(True)
@@ -64,6 +93,12 @@ class test_space_ship(unittest.TestCase):
         ship.set_velocity(1, 2, 3)
         self.assertEqual(ship.get_velocity(), (1, 2, 3))
 
+    def test_set_position_stored_as_float(self):
+        ship = SpaceshipNavigation()
+        ship.set_position(1, 2.5, "3")
+        for coordinate in ship.get_position():
+            self.assertIs(type(coordinate), float)
+
     # Move
     def test_move_locked(self):
         ship = SpaceshipNavigation()
@@ -81,6 +116,11 @@ class test_space_ship(unittest.TestCase):
         result = ship.move(0, 0, 0)
         self.assertTrue(result)
 
+    def test_move_zero_locked(self):
+        ship = SpaceshipNavigation()
+        ship.lock_navigation(True)
+        self.assertFalse(ship.move(0, 0, 0))
+
     def test_move_changed_locked(self):
         ship = SpaceshipNavigation()
         ship.lock_navigation(True)
@@ -119,6 +159,32 @@ class test_space_ship(unittest.TestCase):
         move = ship.move(1000, 2000, 3000)
         self.assertFalse(move)
 
+    def test_move_exact_fuel(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.move(600, 0, 800))
+        self.assertEqual(ship.fuel_level, 0.0)
+        self.assertFalse(ship.move(0, 1, 0))
+
+    def test_move_exact_fuel_rounding(self):
+        ship = SpaceshipNavigation()
+        ship.fuel_level = math.sqrt(0.9*0.9*2)
+        self.assertTrue(ship.move(0.9, 0.9, 0))
+
+    def test_move_exact_fuel_matches_distance(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            ship = SpaceshipNavigation()
+            dx, dy, dz = rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)
+            ship.fuel_consumption_rate = rng.uniform(0.1, 3)
+            ship.fuel_level = math.sqrt(dx*dx + dy*dy + dz*dz) * ship.fuel_consumption_rate
+            self.assertTrue(ship.move(dx, dy, dz))
+
+    def test_move_free_fuel(self):
+        ship = SpaceshipNavigation()
+        ship.fuel_consumption_rate = 0.0
+        self.assertTrue(ship.move(5000, 0, 0))
+        self.assertEqual(ship.fuel_level, 1000.0)
+
     # Accelerate
     def test_accelerate_locked(self):
         ship = SpaceshipNavigation()
@@ -158,11 +224,62 @@ class test_space_ship(unittest.TestCase):
         result = ship.accelerate(999, 999, 999, 10)
         self.assertFalse(result)
 
+    def test_accelerate_component_limit(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.accelerate(9, 9, 9, 10))
+        self.assertFalse(ship.accelerate(1, 0, 0, 11))
+
     def test_accelerate_no_fuel(self):
         ship = SpaceshipNavigation()
         accelerate = ship.accelerate(10, 10, 10, 9999)
         self.assertFalse(accelerate)
 
+    # Time step
+    def test_navigate_time_step(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(3, 0, 4)
+        self.assertTrue(ship.navigate_time_step(2))
+        self.assertEqual(ship.get_position(), (6.0, 0.0, 8.0))
+        self.assertEqual(ship.fuel_level, 990.0)
+
+    def test_navigate_time_step_stationary(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.navigate_time_step(1))
+        self.assertEqual(ship.get_history(), [(0.0, 0.0, 0.0)])
+
+    def test_navigate_time_step_no_fuel(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(100, 0, 0)
+        self.assertFalse(ship.navigate_time_step(11))
+        self.assertEqual(ship.get_position(), (0, 0, 0))
+
+    def test_navigate_time_step_locked(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(1, 0, 0)
+        ship.lock_navigation(True)
+        self.assertFalse(ship.navigate_time_step(1))
+
+    # Fuel
+    def test_refuel(self):
+        ship = SpaceshipNavigation()
+        ship.move(100, 0, 0)
+        self.assertEqual(ship.refuel(500), 100.0)
+        self.assertEqual(ship.get_fuel_percentage(), 100.0)
+
+    def test_refuel_many(self):
+        ships = [SpaceshipNavigation() for _ in range(3)]
+        ships[0].move(100, 0, 0)
+        ships[1].move(300, 0, 0)
+        added = SpaceshipNavigation.refuel_many(ships, [50, 500, -5])
+        self.assertEqual(added.tolist(), [50.0, 300.0, 0.0])
+        self.assertEqual([ship.fuel_level for ship in ships], [950.0, 1000.0, 1000.0])
+
+    def test_refuel_many_scalar_amount(self):
+        ships = [SpaceshipNavigation(), SpaceshipNavigation()]
+        ships[0].move(10, 0, 0)
+        added = SpaceshipNavigation.refuel_many(ships, 5)
+        self.assertEqual(added.tolist(), [5.0, 0.0])
+
     # Distance
     def test_calculate_distance(self):
         ship = SpaceshipNavigation()
@@ -175,5 +292,253 @@ class test_space_ship(unittest.TestCase):
         calculate_distance = ship.calculate_distance_to(10, 10, 10)
         self.assertEqual(calculate_distance, math.sqrt(75))
 
+    # Heading
+    def test_calculate_heading(self):
+        ship = SpaceshipNavigation()
+        azimuth, elevation = ship.calculate_heading_to(0, 10, 0)
+        self.assertAlmostEqual(azimuth, math.pi / 2)
+        self.assertEqual(elevation, 0.0)
+
+    def test_calculate_heading_same_position(self):
+        ship = SpaceshipNavigation()
+        self.assertEqual(ship.calculate_heading_to(0, 0, 0), (0.0, 0.0))
+
+    def test_navigate_to_target(self):
+        ship = SpaceshipNavigation()
+        ship.navigate_to_target(0, 30, 40, 10)
+        self.assertEqual(ship.get_velocity(), (0.0, 6.0, 8.0))
+
+    # Navigation mode
+    def test_set_navigation_mode(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.set_navigation_mode(NavigationMode.AUTOPILOT))
+        self.assertEqual(ship.navigation_mode, NavigationMode.AUTOPILOT)
+        self.assertEqual(ship.get_navigation_status().navigation_mode, "autopilot")
+
+    def test_navigation_mode_is_int(self):
+        ship = SpaceshipNavigation()
+        ship.set_navigation_mode(NavigationMode.EMERGENCY)
+        self.assertEqual(ship.navigation_mode, 2)
+        self.assertEqual(ship.get_navigation_status().navigation_mode, "emergency")
+
+    def test_set_navigation_mode_invalid(self):
+        ship = SpaceshipNavigation()
+        self.assertFalse(ship.set_navigation_mode('autopilot'))
+        self.assertIs(ship.navigation_mode, NavigationMode.MANUAL)
+
+    def test_navigation_mode_rejects_plain_int(self):
+        ship = SpaceshipNavigation()
+        self.assertFalse(ship.set_navigation_mode(2))
+        with self.assertRaises(ValueError):
+            ship.navigation_mode = 1
+        self.assertIs(ship.navigation_mode, NavigationMode.MANUAL)
+        ship.navigation_mode = NavigationMode.AUTOPILOT
+        self.assertIs(ship.navigation_mode, NavigationMode.AUTOPILOT)
+
+    def test_set_navigation_mode_locked(self):
+        ship = SpaceshipNavigation()
+        ship.lock_navigation(True)
+        self.assertFalse(ship.set_navigation_mode(NavigationMode.AUTOPILOT))
+        self.assertTrue(ship.set_navigation_mode(NavigationMode.EMERGENCY))
+
+    def test_lock_requires_manual_mode(self):
+        ship = SpaceshipNavigation()
+        ship.set_navigation_mode(NavigationMode.AUTOPILOT)
+        self.assertFalse(ship.lock_navigation(True))
+        self.assertTrue(ship.lock_navigation(False))
+
+    def test_emergency_stop(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(1, 2, 3)
+        self.assertEqual(ship.get_velocity(), (1, 2, 3))
+        ship.lock_navigation(True)
+        self.assertTrue(ship.emergency_stop())
+        self.assertEqual(ship.get_velocity(), (0, 0, 0))
+        self.assertIs(ship.navigation_mode, NavigationMode.EMERGENCY)
+        self.assertFalse(ship.navigation_locked)
+
+    # Status
+    def test_navigation_status(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(1, 1, 1)
+        ship.move(1, 0, 0)
+        status = ship.get_navigation_status()
+        self.assertEqual(status.position, (1.0, 0.0, 0.0))
+        self.assertEqual(status.fuel_level, 999.0)
+        self.assertEqual(status.waypoints_remaining, 1)
+        self.assertEqual(status.total_distance_traveled, 2)
+
+    def test_navigation_status_as_dict(self):
+        ship = SpaceshipNavigation()
+        status = ship.get_navigation_status().as_dict()
+        self.assertIsInstance(status, dict)
+        self.assertEqual(status['navigation_mode'], "manual")
+        self.assertFalse(status['navigation_locked'])
+
+    def test_navigation_status_is_tuple(self):
+        ship = SpaceshipNavigation()
+        status = ship.get_navigation_status()
+        self.assertEqual(status[0], ship.get_position())
+        with self.assertRaises(TypeError):
+            status['fuel_level']
+
+    # History
+    def test_history_records_moves(self):
+        ship = SpaceshipNavigation()
+        ship.move(1, 0, 0)
+        self.assertEqual(ship.get_history(), [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+
+    def test_history_size_limit(self):
+        ship = SpaceshipNavigation()
+        for i in range(150):
+            ship.set_position(i, 0, 0)
+        history = ship.get_history()
+        self.assertEqual(len(history), ship.max_history_size)
+        self.assertEqual(history[0], (50.0, 0.0, 0.0))
+        self.assertEqual(history[-1], (149.0, 0.0, 0.0))
+
+    def test_navigate_to_axis_target_at_max_speed(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.navigate_to_target(11, 0, 0))
+        self.assertEqual(ship.get_velocity(), (100.0, 0.0, 0.0))
+
+    def test_navigate_to_axis_targets(self):
+        ship = SpaceshipNavigation()
+        for x in range(1, 2000):
+            self.assertTrue(ship.navigate_to_target(x, 0, 0), x)
+
+    def test_navigate_waypoint_route_axis_target(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(11, 0, 0)
+        self.assertTrue(ship.navigate_waypoint_route())
+        self.assertEqual(ship.get_velocity(), (100.0, 0.0, 0.0))
+
+    def test_navigate_to_current_position(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(1, 2, 3)
+        self.assertTrue(ship.navigate_to_target(0, 0, 0))
+        self.assertEqual(ship.get_velocity(), (0, 0, 0))
+
+    def test_history_size_changed(self):
+        ship = SpaceshipNavigation()
+        ship.max_history_size = 5
+        for i in range(10):
+            ship.set_position(i, 0, 0)
+        history = ship.get_history()
+        self.assertEqual(len(history), 5)
+        self.assertEqual(history[0], (5.0, 0.0, 0.0))
+
+    def test_history_size_shrunk_keeps_newest(self):
+        ship = SpaceshipNavigation()
+        for i in range(10):
+            ship.set_position(i, 0, 0)
+        ship.max_history_size = 3
+        self.assertEqual(ship.get_history(), [(7.0, 0.0, 0.0), (8.0, 0.0, 0.0), (9.0, 0.0, 0.0)])
+
+    def test_navigate_to_nan_target(self):
+        ship = SpaceshipNavigation()
+        self.assertTrue(ship.navigate_to_target(float('nan'), 0, 0))
+        self.assertTrue(all(math.isnan(v) for v in ship.get_velocity()))
+
+    # Waypoints
+    def test_add_waypoint_grows(self):
+        ship = SpaceshipNavigation()
+        for i in range(40):
+            ship.add_waypoint(i, 0, 0)
+        self.assertEqual(ship.waypoint_count, 40)
+        self.assertEqual(ship.waypoints[39], (39.0, 0.0, 0.0))
+
+    def test_waypoints_read_only(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(1, 2, 3)
+        self.assertEqual(ship.waypoints, ((1.0, 2.0, 3.0),))
+        with self.assertRaises(AttributeError):
+            ship.waypoints.append((4, 5, 6))
+        with self.assertRaises(AttributeError):
+            ship.waypoints = ()
+
+    def test_add_waypoint_invalid(self):
+        ship = SpaceshipNavigation()
+        with self.assertRaises(TypeError):
+            ship.add_waypoint(None, 0, 0)
+        self.assertEqual(ship.waypoint_count, 0)
+
+    def test_get_next_waypoint(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(1, 2, 3)
+        self.assertEqual(ship.get_next_waypoint(), (1.0, 2.0, 3.0))
+        self.assertIsInstance(ship.get_next_waypoint()[0], float)
+
+    def test_distances_to_all_waypoints(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(3, 4, 0)
+        ship.add_waypoint(0, 0, 10)
+        self.assertEqual(ship.distances_to_all_waypoints().tolist(), [5.0, 10.0])
+
+    def test_can_reach_waypoints(self):
+        ship = SpaceshipNavigation()
+        ship.add_waypoint(10, 0, 0)
+        ship.add_waypoint(5000, 0, 0)
+        self.assertEqual(ship.can_reach_waypoints().tolist(), [True, False])
+
+    # Fleet
+    def test_step_fleet(self):
+        positions = np.zeros((3, 3))
+        velocities = np.array([[3.0, 0.0, 4.0], [100.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        fuel = np.array([1000.0, 50.0, 0.0])
+        moved = step_fleet(positions, velocities, fuel, 1.0, 2.0)
+        self.assertEqual(moved.tolist(), [True, False, True])
+        self.assertEqual(positions.tolist(), [[6.0, 0.0, 8.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        self.assertEqual(fuel.tolist(), [990.0, 50.0, 0.0])
+
+    def test_step_fleet_matches_ship(self):
+        ship = SpaceshipNavigation()
+        ship.set_velocity(1, 2, 3)
+        ship.navigate_time_step(0.5)
+        positions = np.zeros((1, 3))
+        fuel = np.array([1000.0])
+        step_fleet(positions, np.array([[1.0, 2.0, 3.0]]), fuel, 1.0, 0.5)
+        self.assertEqual(tuple(positions[0].tolist()), ship.get_position())
+        self.assertAlmostEqual(fuel[0], ship.fuel_level)
+
+    def test_step_fleet_int_scalars(self):
+        positions = np.zeros((1, 3))
+        fuel = np.array([100.0])
+        moved = step_fleet(positions, np.array([[1.0, 0.0, 0.0]]), fuel, 1, 2)
+        self.assertTrue(moved[0])
+        self.assertEqual(positions.tolist(), [[2.0, 0.0, 0.0]])
+        self.assertEqual(fuel.tolist(), [98.0])
+
+    def test_step_fleet_zero_time(self):
+        positions = np.zeros((2, 3))
+        moved = step_fleet(positions, np.ones((2, 3)), np.full(2, 10.0), 1.0, 0)
+        self.assertFalse(moved.any())
+
+    def test_step_fleet_mismatched_velocities(self):
+        positions = np.zeros((4, 3))
+        with self.assertRaises(ValueError):
+            step_fleet(positions, np.ones((1, 3)), np.full(4, 10.0), 1.0, 1.0)
+        self.assertEqual(positions.tolist(), np.zeros((4, 3)).tolist())
+
+    def test_step_fleet_wrong_columns(self):
+        with self.assertRaises(ValueError):
+            step_fleet(np.zeros((2, 2)), np.ones((2, 2)), np.full(2, 10.0), 1.0, 1.0)
+
+    def test_step_fleet_mismatched_fuel(self):
+        with self.assertRaises(ValueError):
+            step_fleet(np.zeros((2, 3)), np.ones((2, 3)), np.full(3, 10.0), 1.0, 1.0)
+
+    def test_step_fleet_float32_positions(self):
+        with self.assertRaises(TypeError):
+            step_fleet(np.zeros((2, 3), dtype=np.float32), np.ones((2, 3)), np.full(2, 10.0), 1.0, 1.0)
+
+    def test_step_fleet_read_only_velocities(self):
+        velocities = np.ones((2, 3))
+        velocities.flags.writeable = False
+        positions = np.zeros((2, 3))
+        moved = step_fleet(positions, velocities, np.full(2, 10.0), 1.0, 1.0)
+        self.assertTrue(moved.all())
+        self.assertEqual(positions.tolist(), [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]])
+
 if __name__ == "__main__":
     unittest.main()